@@ -2,6 +2,11 @@ import flet as ft
 import pyperclip
 import os
 import importlib.util
+import csv
+import gzip
+import hashlib
+import json
+import time
 
 # Import default messages from config file
 try:
@@ -39,10 +44,120 @@ class walinkgen:
         cleaned_number = walinkgen.clean_phone_number(phone_number)
         return f"wa.me/{cleaned_number}"
 
+class StartupCache:
+    # Bump when the snapshot layout changes so old caches are ignored
+    version = 1
+
+    def __init__(self, filename="startup_cache.json"):
+        self.filename = filename
+        self.snapshot = self.read_snapshot()
+
+    def read_snapshot(self):
+        # Return the stored snapshot, or an empty one if it is missing or corrupted
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if not isinstance(snapshot, dict):
+                return {}
+            checksum = snapshot.pop("checksum")
+            if snapshot.get("version") != self.version or checksum != self.checksum(snapshot):
+                return {}
+            return snapshot
+        except (OSError, ValueError, KeyError, AttributeError):
+            return {}
+
+    def write_snapshot(self):
+        # Write to a temp file and swap it in, so a crash never leaves a half-written cache
+        snapshot = dict(self.snapshot, version=self.version)
+        snapshot["checksum"] = self.checksum(snapshot)
+        temp_filename = self.filename + ".tmp"
+        try:
+            with open(temp_filename, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_filename, self.filename)
+        except OSError:
+            # The cache is only a speed-up, the app works fine without it
+            pass
+
+    @staticmethod
+    def checksum(snapshot):
+        return hashlib.sha256(json.dumps(snapshot, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def hash_file(filename):
+        with open(filename, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def load_messages(self, store_filename):
+        # Return (messages, previews) if the store is unchanged since the snapshot, else None
+        store = self.snapshot.get("store")
+        if not isinstance(store, dict) or store.get("path") != os.path.abspath(store_filename):
+            return None
+
+        try:
+            stat = os.stat(store_filename)
+            if (stat.st_mtime_ns, stat.st_size) != (store.get("mtime_ns"), store.get("size")):
+                # mtime can move without the content changing, so fall back to the hash
+                if stat.st_size != store.get("size") or self.hash_file(store_filename) != store.get("sha256"):
+                    return None
+                store["mtime_ns"] = stat.st_mtime_ns
+                self.write_snapshot()
+        except OSError:
+            return None
+
+        messages = self.snapshot.get("messages")
+        previews = self.snapshot.get("previews")
+        if not isinstance(messages, dict) or not isinstance(previews, dict) or messages.keys() != previews.keys():
+            return None
+        return dict(messages), dict(previews)
+
+    def save_messages(self, store_filename, messages, previews):
+        try:
+            stat = os.stat(store_filename)
+            sha256 = self.hash_file(store_filename)
+        except OSError:
+            return
+        self.snapshot["store"] = {
+            "path": os.path.abspath(store_filename),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256
+        }
+        # Copy so later in-memory edits can't leak into the snapshot before the store is written
+        self.snapshot["messages"] = dict(messages)
+        self.snapshot["previews"] = dict(previews)
+        self.write_snapshot()
+
+    def load_theme(self):
+        return self.snapshot.get("is_dark") is True
+
+    def save_theme(self, is_dark):
+        self.snapshot["is_dark"] = is_dark
+        self.write_snapshot()
+
 class MessageManager:
-    def __init__(self, filename="saved_messages.py"):
+    def __init__(self, filename="saved_messages.py", cache=None):
         self.filename = filename
-        self.messages = self.load_messages()
+        self.cache = cache
+
+        # Skip executing the store when the startup cache still matches it
+        cached = self.cache.load_messages(self.filename) if self.cache else None
+        if cached:
+            self.messages, self.previews = cached
+        else:
+            self.messages = self.load_messages()
+            self.update_previews()
+
+    @staticmethod
+    def make_preview(content):
+        return content[:60] + "..." if len(content) > 60 else content
+
+    def update_previews(self):
+        self.previews = {title: self.make_preview(content) for title, content in self.messages.items()}
+        if self.cache:
+            self.cache.save_messages(self.filename, self.messages, self.previews)
     
     def load_messages(self):
         if os.path.exists(self.filename):
@@ -89,6 +204,7 @@ In case you prefer not to be contacted further/are not XX, then please let me kn
                 else:
                     f.write(f'    "{title}": "{escaped_content}",\n')
             f.write('}\n')
+        self.update_previews()
     
     def add_message(self, title, content):
         # Add new message
@@ -110,9 +226,323 @@ In case you prefer not to be contacted further/are not XX, then please let me kn
             return True
         return False
 
+class CampaignExporter:
+    # Columns written for every CSV row, the title and message go in a .json sidecar instead
+    columns = ["phone_number", "link"]
+
+    def __init__(self, chunk_size=100000):
+        self.chunk_size = chunk_size
+
+    def iter_chunks(self, phone_numbers):
+        # Yield (phone_number, link) pairs in chunks so only one chunk is held in memory
+        chunk = []
+        for phone_number in phone_numbers:
+            phone_number = phone_number.strip()
+            if not phone_number:
+                continue
+            chunk.append((phone_number, walinkgen.generate_walink(phone_number)))
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def export(self, filename, phone_numbers, message_manager=None, title=""):
+        # Write the campaign to Parquet when pyarrow is available, otherwise to CSV (.csv or .csv.gz)
+        if not filename.endswith((".parquet", ".csv", ".csv.gz")):
+            raise ValueError("Export filename must end in .parquet, .csv or .csv.gz")
+
+        content = ""
+        if message_manager is not None and title:
+            if title not in message_manager.messages:
+                raise ValueError(f'No saved message titled "{title}"')
+            content = message_manager.messages[title]
+
+        if filename.endswith(".parquet"):
+            # pyarrow is optional and only looked up here, so it never slows down app launch
+            if importlib.util.find_spec("pyarrow") is not None:
+                return self.export_parquet(filename, phone_numbers, title, content)
+            filename = filename[:-len(".parquet")] + ".csv.gz"
+        return self.export_csv(filename, phone_numbers, title, content)
+
+    def export_parquet(self, filename, phone_numbers, title="", content=""):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Title and message are the same for every row, so store them dictionary-encoded
+        schema = pa.schema([
+            ("phone_number", pa.string()),
+            ("link", pa.string()),
+            ("title", pa.dictionary(pa.int32(), pa.string())),
+            ("message", pa.dictionary(pa.int32(), pa.string()))
+        ])
+        title_values = pa.array([title], pa.string())
+        content_values = pa.array([content], pa.string())
+        rows = 0
+
+        with pq.ParquetWriter(filename, schema, compression="zstd") as writer:
+            for chunk in self.iter_chunks(phone_numbers):
+                numbers, links = zip(*chunk)
+                indices = pa.array([0] * len(chunk), pa.int32())
+                writer.write_table(pa.Table.from_arrays([
+                    pa.array(numbers, pa.string()),
+                    pa.array(links, pa.string()),
+                    pa.DictionaryArray.from_arrays(indices, title_values),
+                    pa.DictionaryArray.from_arrays(indices, content_values)
+                ], schema=schema))
+                rows += len(chunk)
+        return filename, rows
+
+    def export_csv(self, filename, phone_numbers, title="", content=""):
+        # Title and message never change, so write them once next to the CSV instead of on every row
+        with open(filename + ".json", 'w', encoding='utf-8') as f:
+            json.dump({"title": title, "message": content}, f, ensure_ascii=False, indent=2)
+        rows = 0
+
+        # Gzip level 1 keeps compression from becoming the bottleneck on large campaigns
+        if filename.endswith(".gz"):
+            output = gzip.open(filename, 'wb', compresslevel=1)
+        else:
+            output = open(filename, 'wb')
+
+        with output as f:
+            f.write((",".join(self.columns) + "\r\n").encode('utf-8'))
+            for chunk in self.iter_chunks(phone_numbers):
+                f.write("".join(
+                    self.quote_csv(number) + "," + link + "\r\n"
+                    for number, link in chunk
+                ).encode('utf-8'))
+                rows += len(chunk)
+        return filename, rows
+
+    @staticmethod
+    def quote_csv(value):
+        # Phone numbers are typed by hand, so quote them only if they break the CSV format
+        if ',' in value or '"' in value or '\n' in value or '\r' in value:
+            return '"' + value.replace('"', '""') + '"'
+        return value
+
+class OutreachQueue:
+    # Pacing used when neither the caller nor the saved cursor sets one
+    default_per_minute = 20
+
+    def __init__(self, filename="outreach_queue.jsonl", message_manager=None, per_minute=None):
+        # Jobs are appended to a log file, the cursor file records how far we've completed
+        self.filename = filename
+        self.cursor_filename = filename + ".cursor"
+        self.skipped_filename = filename + ".skipped"
+        self.message_manager = message_manager
+
+        state = self.read_state()
+        if per_minute is None:
+            per_minute = state["per_minute"] if state else self.default_per_minute
+        if per_minute <= 0:
+            raise ValueError("per_minute must be greater than 0")
+        self.per_minute = per_minute
+
+        self.state = state or {
+            "offset": 0,
+            "generation": 0,
+            "done": [],
+            "completed": 0,
+            "skipped": 0,
+            "tokens": per_minute,
+            "updated": time.time()
+        }
+        self.state["per_minute"] = per_minute
+        self.repair_log()
+
+        # Jobs handed out but not completed yet are handed out again after a restart
+        self.read_offset = self.state["offset"]
+        # End offsets of handed-out jobs in log order, mapped to whether they are done
+        self.in_flight = {}
+        # Done jobs past the cursor, kept so they aren't handed out again after a restart
+        self.done = set(self.state["done"])
+        # Jobs skipped by the last dequeue because their message template no longer exists
+        self.skipped = []
+
+    def read_state(self):
+        try:
+            with open(self.cursor_filename, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if not isinstance(state, dict):
+                return None
+            # Cursors written before these were tracked are still valid
+            state.setdefault("skipped", 0)
+            state.setdefault("per_minute", self.default_per_minute)
+            if (all(isinstance(state.get(key), int) for key in ("offset", "generation", "completed", "skipped"))
+                    and all(isinstance(state.get(key), (int, float)) for key in ("tokens", "updated", "per_minute"))
+                    and state["per_minute"] > 0
+                    and isinstance(state.get("done"), list)):
+                return state
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def write_state(self):
+        # Swap the cursor in atomically so a crash can't lose completed progress
+        self.state["done"] = sorted(self.done)
+        temp_filename = self.cursor_filename + ".tmp"
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_filename, self.cursor_filename)
+
+    def repair_log(self):
+        # Drop a half-written last line left behind by a crash during enqueue
+        end = 0
+        if os.path.exists(self.filename):
+            with open(self.filename, 'r+b') as f:
+                size = f.seek(0, os.SEEK_END)
+                end = size
+                while end > 0:
+                    start = max(0, end - 4096)
+                    f.seek(start)
+                    block = f.read(end - start)
+                    newline = block.rfind(b"\n")
+                    if newline != -1:
+                        end = start + newline + 1
+                        break
+                    end = start
+                if end != size:
+                    f.truncate(end)
+        if self.state["offset"] > end:
+            # The log was emptied after everything in it was completed, so start a new generation
+            self.state["offset"] = 0
+            self.state["done"] = []
+            self.state["generation"] += 1
+
+    def set_per_minute(self, per_minute):
+        # Change the pacing and keep it for the next launch
+        if per_minute <= 0:
+            raise ValueError("per_minute must be greater than 0")
+        self.per_minute = per_minute
+        self.state["per_minute"] = per_minute
+        self.write_state()
+
+    def enqueue(self, phone_number, title):
+        self.enqueue_many([(phone_number, title)])
+
+    def enqueue_many(self, jobs):
+        # Append (phone_number, title) jobs to the end of the log
+        lines = "".join(json.dumps([phone_number, title], ensure_ascii=False) + "\n" for phone_number, title in jobs)
+        with open(self.filename, 'ab') as f:
+            f.write(lines.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def refill(self):
+        # Token bucket holding up to a minute's worth of sends
+        now = time.time()
+        elapsed = max(0.0, now - self.state["updated"])
+        self.state["tokens"] = min(self.per_minute, self.state["tokens"] + elapsed * self.per_minute / 60)
+        self.state["updated"] = now
+
+    def wait_time(self):
+        # Seconds until the next job may be dequeued
+        self.refill()
+        return max(0.0, (1 - self.state["tokens"]) * 60 / self.per_minute)
+
+    def dequeue(self, batch_size=1):
+        # Return up to batch_size jobs, limited by the per-minute pacing
+        self.refill()
+        self.skipped = []
+        count = min(batch_size, int(self.state["tokens"]))
+        if count <= 0 or not os.path.exists(self.filename):
+            return []
+
+        jobs = []
+        with open(self.filename, 'rb') as f:
+            f.seek(self.read_offset)
+            while len(jobs) < count:
+                line = f.readline()
+                if not line:
+                    break
+                offset = f.tell()
+                if offset in self.done:
+                    # Completed before a restart, only needed to move the cursor past it
+                    self.in_flight[offset] = True
+                    continue
+
+                phone_number, title = json.loads(line)
+                job = {
+                    "phone_number": phone_number,
+                    "link": walinkgen.generate_walink(phone_number),
+                    "title": title,
+                    "message": None,
+                    "offset": offset,
+                    "generation": self.state["generation"]
+                }
+                if self.message_manager is not None:
+                    job["message"] = self.message_manager.messages.get(title)
+                    if job["message"] is None:
+                        # Never hand out a blank message, set the job aside for the caller to report
+                        self.skipped.append(job)
+                        self.state["skipped"] += 1
+                        self.in_flight[offset] = True
+                        self.done.add(offset)
+                        continue
+
+                self.in_flight[offset] = False
+                jobs.append(job)
+            self.read_offset = f.tell()
+
+        if self.skipped:
+            with open(self.skipped_filename, 'ab') as f:
+                f.write("".join(
+                    json.dumps([job["phone_number"], job["title"]], ensure_ascii=False) + "\n"
+                    for job in self.skipped
+                ).encode('utf-8'))
+        self.state["tokens"] -= len(jobs)
+        self.advance()
+        self.write_state()
+        return jobs
+
+    def complete(self, jobs):
+        # Mark jobs done, the cursor only moves past jobs once everything before them is done too
+        accepted = 0
+        for job in jobs:
+            offset = job["offset"]
+            if job["generation"] != self.state["generation"] or self.in_flight.get(offset) is not False:
+                # Stale, unknown or already completed, so there's nothing to record
+                continue
+            self.in_flight[offset] = True
+            self.done.add(offset)
+            accepted += 1
+
+        if accepted:
+            self.state["completed"] += accepted
+            self.advance()
+            self.write_state()
+        return accepted
+
+    def advance(self):
+        # Move the cursor over the completed jobs at the front of the in-flight list
+        while self.in_flight:
+            offset = next(iter(self.in_flight))
+            if not self.in_flight[offset]:
+                break
+            del self.in_flight[offset]
+            self.done.discard(offset)
+            self.state["offset"] = offset
+
+        # Once nothing is outstanding and the whole log is done, empty it so it doesn't grow forever
+        if (not self.in_flight and not self.done and self.state["offset"] > 0
+                and self.state["offset"] == self.read_offset == os.path.getsize(self.filename)):
+            with open(self.filename, 'r+b') as f:
+                f.truncate(0)
+            self.state["offset"] = 0
+            self.state["generation"] += 1
+            self.read_offset = 0
+
+    def is_empty(self):
+        return not os.path.exists(self.filename) or self.read_offset >= os.path.getsize(self.filename)
+
 class ThemeManager:
-    def __init__(self):
-        self.is_dark = False
+    def __init__(self, cache=None):
+        self.cache = cache
+        self.is_dark = self.cache.load_theme() if self.cache else False
         self.primary_dark = "#1d2a45"
         self.accent_dark = "#b89449"
         self.primary_light = "#ffffff"
@@ -154,8 +584,11 @@ def main(page: ft.Page):
     page.window.maximized = False
     page.window.center()  # Start in the middle of the screen
     
+    # Startup cache, restores the message index and theme without re-reading the store
+    startup_cache = StartupCache()
+    
     # Theme setup
-    theme_manager = ThemeManager()
+    theme_manager = ThemeManager(startup_cache)
     page.fonts = {
         "Jost": "https://fonts.googleapis.com/css2?family=Jost:ital,wght@0,100..900;1,100..900&display=swap"
     }
@@ -163,13 +596,17 @@ def main(page: ft.Page):
     page.dark_theme = ft.Theme(font_family="Jost")
     
     page.title = "Mass Contact App"
-    page.theme_mode = ft.ThemeMode.LIGHT
+    page.theme_mode = ft.ThemeMode.DARK if theme_manager.is_dark else ft.ThemeMode.LIGHT
     page.padding = 20
     page.scroll = ft.ScrollMode.ADAPTIVE
     page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
     
     # Init message manager
-    message_manager = MessageManager()
+    message_manager = MessageManager(cache=startup_cache)
+    
+    # Outreach queue, picks up where the last session left off
+    outreach_queue = OutreachQueue(message_manager=message_manager)
+    current_jobs = []
     
     # Confirmation snackbar, yummy
     confirmation_snackbar = ft.SnackBar(
@@ -189,7 +626,9 @@ def main(page: ft.Page):
         
         # Update all components with new theme
         whatsapp_section.bgcolor = theme["card_bg"]
+        export_section.bgcolor = theme["card_bg"]
         messages_section.bgcolor = theme["card_bg"]
+        queue_section.bgcolor = theme["card_bg"]
         footer_container.bgcolor = theme["card_bg"]
         
         # Update text colors
@@ -198,6 +637,12 @@ def main(page: ft.Page):
         messages_title.color = theme["text_primary"]
         messages_subtitle.color = theme["text_secondary"]
         generated_link.color = theme["accent"]
+        export_title.color = theme["text_primary"]
+        export_subtitle.color = theme["text_secondary"]
+        queue_title.color = theme["text_primary"]
+        queue_subtitle.color = theme["text_secondary"]
+        queue_current.color = theme["accent"]
+        queue_status.color = theme["text_secondary"]
         footer_text.color = theme["text_secondary"]
         
         # Update input fields
@@ -207,6 +652,13 @@ def main(page: ft.Page):
         phone_input.label_style = ft.TextStyle(color=theme["text_secondary"], font_family="Jost")
         phone_input.text_style = ft.TextStyle(font_family="Jost")
         
+        for field in (export_numbers, export_template, queue_numbers, queue_template, queue_rate):
+            field.border_color = theme["border"]
+            field.color = theme["text_primary"]
+            field.focused_border_color = theme["accent"]
+            field.label_style = ft.TextStyle(color=theme["text_secondary"], font_family="Jost")
+            field.text_style = ft.TextStyle(font_family="Jost")
+        
         # Update buttons
         generate_btn.style = ft.ButtonStyle(
             color=ft.Colors.WHITE,
@@ -222,6 +674,14 @@ def main(page: ft.Page):
             shape=ft.RoundedRectangleBorder(radius=8)
         )
         
+        for button in (export_btn, queue_add_btn, queue_next_btn, queue_copy_btn, queue_done_btn):
+            button.style = ft.ButtonStyle(
+                color=ft.Colors.WHITE,
+                bgcolor=theme["accent"],
+                elevation=8,
+                shape=ft.RoundedRectangleBorder(radius=8)
+            )
+        
         # Update message tiles container
         message_container.border = ft.border.all(1, theme["border"])
         message_container.bgcolor = theme["bg_surface"]
@@ -242,12 +702,13 @@ def main(page: ft.Page):
         page.theme_mode = ft.ThemeMode.DARK if theme_manager.is_dark else ft.ThemeMode.LIGHT
         theme_btn.icon = ft.Icons.DARK_MODE if theme_manager.is_dark else ft.Icons.LIGHT_MODE
         theme_btn.tooltip = "Switch to Light Mode" if theme_manager.is_dark else "Switch to Dark Mode"
+        startup_cache.save_theme(theme_manager.is_dark)
         apply_theme()
     
     # Theme toggle button
     theme_btn = ft.IconButton(
-        icon=ft.Icons.LIGHT_MODE,
-        tooltip="Switch to Dark Mode",
+        icon=ft.Icons.DARK_MODE if theme_manager.is_dark else ft.Icons.LIGHT_MODE,
+        tooltip="Switch to Light Mode" if theme_manager.is_dark else "Switch to Dark Mode",
         on_click=toggle_theme,
         style=ft.ButtonStyle(
             color=ft.Colors.WHITE,
@@ -340,6 +801,103 @@ def main(page: ft.Page):
         width=600
     )
     
+    # Export Campaign Section
+    def open_export_dialog(e):
+        if not (export_numbers.value or "").strip() or not export_template.value:
+            show_confirmation("Enter phone numbers and pick a message.")
+            return
+        export_picker.save_file(
+            dialog_title="Export Campaign",
+            file_name="campaign.parquet",
+            allowed_extensions=["parquet", "csv", "gz"]
+        )
+    
+    def export_campaign(e):
+        if not e.path:
+            return
+        
+        try:
+            filename, rows = CampaignExporter().export(
+                e.path,
+                export_numbers.value.splitlines(),
+                message_manager,
+                export_template.value
+            )
+            show_confirmation(f"Exported {rows} links to {os.path.basename(filename)}")
+        except (ValueError, OSError) as ex:
+            show_confirmation(f"Error exporting campaign: {str(ex)}")
+    
+    export_picker = ft.FilePicker(on_result=export_campaign)
+    
+    export_title = ft.Text(
+        "Export Campaign",
+        size=24,
+        weight=ft.FontWeight.W_700,
+        font_family="Jost",
+        text_align=ft.TextAlign.CENTER
+    )
+    
+    export_subtitle = ft.Text(
+        "Save links and a message for many numbers as .parquet, .csv or .csv.gz.",
+        size=14,
+        font_family="Jost",
+        text_align=ft.TextAlign.CENTER
+    )
+    
+    export_numbers = ft.TextField(
+        label="Phone Numbers (one per line)",
+        multiline=True,
+        min_lines=3,
+        max_lines=6,
+        width=400,
+        border_radius=8,
+        filled=True,
+        text_size=14,
+        text_style=ft.TextStyle(font_family="Jost"),
+        label_style=ft.TextStyle(font_family="Jost"),
+        text_align=ft.TextAlign.LEFT
+    )
+    
+    export_template = ft.Dropdown(
+        label="Message",
+        width=400,
+        border_radius=8,
+        filled=True,
+        text_size=14,
+        text_style=ft.TextStyle(font_family="Jost"),
+        label_style=ft.TextStyle(font_family="Jost")
+    )
+    
+    export_btn = ft.ElevatedButton(
+        text="Export Campaign",
+        icon=ft.Icons.FILE_DOWNLOAD,
+        on_click=open_export_dialog,
+        style=ft.ButtonStyle(
+            shape=ft.RoundedRectangleBorder(radius=8),
+            elevation=8
+        )
+    )
+    
+    export_section = ft.Container(
+        content=ft.Column([
+            ft.Row([export_title], alignment=ft.MainAxisAlignment.CENTER),
+            export_subtitle,
+            ft.Container(export_numbers, alignment=ft.alignment.center),
+            ft.Container(export_template, alignment=ft.alignment.center),
+            ft.Container(export_btn, alignment=ft.alignment.center)
+        ], spacing=15, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+        padding=25,
+        margin=10,
+        border_radius=15,
+        shadow=ft.BoxShadow(
+            spread_radius=1,
+            blur_radius=15,
+            color=ft.Colors.BLACK12,
+            offset=ft.Offset(0, 4)
+        ),
+        width=600
+    )
+    
     # Pre-saved Messages Section
     message_tiles = ft.Column(spacing=8)
     
@@ -372,7 +930,7 @@ def main(page: ft.Page):
                         text_align=ft.TextAlign.LEFT
                     ),
                     subtitle=ft.Text(
-                        content[:60] + "..." if len(content) > 60 else content,  # Changed from 80 to 60 characters
+                        message_manager.previews[title],
                         font_family="Jost",
                         color=theme["text_secondary"],
                         text_align=ft.TextAlign.LEFT
@@ -415,6 +973,12 @@ def main(page: ft.Page):
             
             message_tiles.controls.append(tile_container)
         
+        # Keep the export and queue message pickers in sync with the saved messages
+        for picker in (export_template, queue_template):
+            picker.options = [ft.dropdown.Option(title) for title in message_manager.messages]
+            if picker.value not in message_manager.messages:
+                picker.value = None
+        
         page.update()
     
     # Add Message Dialog
@@ -631,6 +1195,220 @@ def main(page: ft.Page):
         width=600
     )
     
+    # Outreach Queue Section
+    def update_queue_status():
+        status = f"Done: {outreach_queue.state['completed']}"
+        if outreach_queue.state["skipped"]:
+            status += f" • Skipped: {outreach_queue.state['skipped']}"
+        if outreach_queue.is_empty() and not current_jobs:
+            status += " • Queue empty"
+        queue_status.value = status
+        if current_jobs:
+            queue_current.value = f"Current: {current_jobs[0]['phone_number']} ({current_jobs[0]['title']})"
+        else:
+            queue_current.value = ""
+    
+    def add_to_queue(e):
+        numbers = [line.strip() for line in (queue_numbers.value or "").splitlines() if line.strip()]
+        title = queue_template.value
+        
+        if not numbers or not title:
+            show_confirmation("Enter phone numbers and pick a message.")
+            return
+        
+        outreach_queue.enqueue_many((number, title) for number in numbers)
+        queue_numbers.value = ""
+        update_queue_status()
+        show_confirmation(f"Added {len(numbers)} numbers to the queue")
+    
+    def set_queue_rate(e):
+        try:
+            outreach_queue.set_per_minute(int(queue_rate.value))
+        except (TypeError, ValueError):
+            queue_rate.value = str(outreach_queue.per_minute)
+            show_confirmation("Messages per minute must be a whole number above 0")
+            return
+        page.update()
+    
+    def next_in_queue(e):
+        if current_jobs:
+            show_confirmation("Mark the current number as done first")
+            return
+        
+        wait = outreach_queue.wait_time()
+        if wait > 0:
+            show_confirmation(f"Pacing: next number in {int(wait) + 1}s")
+            return
+        
+        jobs = outreach_queue.dequeue(1)
+        skipped = ""
+        if outreach_queue.skipped:
+            skipped = f"Skipped {len(outreach_queue.skipped)} numbers whose message no longer exists. "
+        
+        if not jobs:
+            update_queue_status()
+            show_confirmation(skipped + "Queue is empty")
+            return
+        
+        current_jobs.extend(jobs)
+        pyperclip.copy(jobs[0]["link"])
+        update_queue_status()
+        show_confirmation(skipped + "Copied WhatsApp link: " + jobs[0]["link"])
+    
+    def copy_queue_message(e):
+        if not current_jobs:
+            show_confirmation("Press Next to get a number first")
+            return
+        copy_message(current_jobs[0]["title"], current_jobs[0]["message"])
+    
+    def mark_queue_done(e):
+        if not current_jobs:
+            show_confirmation("Press Next to get a number first")
+            return
+        outreach_queue.complete(current_jobs)
+        current_jobs.clear()
+        update_queue_status()
+        show_confirmation("Marked as done")
+    
+    queue_title = ft.Text(
+        "Outreach Queue",
+        size=24,
+        weight=ft.FontWeight.W_700,
+        font_family="Jost",
+        text_align=ft.TextAlign.CENTER
+    )
+    
+    queue_subtitle = ft.Text(
+        "Queue numbers up and work through them at a steady pace. Your place is kept if the app closes.",
+        size=14,
+        font_family="Jost",
+        text_align=ft.TextAlign.CENTER
+    )
+    
+    queue_numbers = ft.TextField(
+        label="Phone Numbers (one per line)",
+        multiline=True,
+        min_lines=3,
+        max_lines=6,
+        width=400,
+        border_radius=8,
+        filled=True,
+        text_size=14,
+        text_style=ft.TextStyle(font_family="Jost"),
+        label_style=ft.TextStyle(font_family="Jost"),
+        text_align=ft.TextAlign.LEFT
+    )
+    
+    queue_template = ft.Dropdown(
+        label="Message",
+        width=400,
+        border_radius=8,
+        filled=True,
+        text_size=14,
+        text_style=ft.TextStyle(font_family="Jost"),
+        label_style=ft.TextStyle(font_family="Jost")
+    )
+    
+    queue_rate = ft.TextField(
+        label="Messages per minute",
+        value=str(outreach_queue.per_minute),
+        width=400,
+        border_radius=8,
+        filled=True,
+        text_size=14,
+        keyboard_type=ft.KeyboardType.NUMBER,
+        text_style=ft.TextStyle(font_family="Jost"),
+        label_style=ft.TextStyle(font_family="Jost"),
+        text_align=ft.TextAlign.LEFT,
+        on_blur=set_queue_rate,
+        on_submit=set_queue_rate
+    )
+    
+    queue_add_btn = ft.ElevatedButton(
+        text="Add to Queue",
+        icon=ft.Icons.PLAYLIST_ADD,
+        on_click=add_to_queue,
+        style=ft.ButtonStyle(
+            shape=ft.RoundedRectangleBorder(radius=8),
+            elevation=8
+        )
+    )
+    
+    queue_next_btn = ft.ElevatedButton(
+        text="Next",
+        icon=ft.Icons.SKIP_NEXT,
+        on_click=next_in_queue,
+        style=ft.ButtonStyle(
+            shape=ft.RoundedRectangleBorder(radius=8),
+            elevation=8
+        )
+    )
+    
+    queue_copy_btn = ft.ElevatedButton(
+        text="Copy Message",
+        icon=ft.Icons.CONTENT_COPY,
+        on_click=copy_queue_message,
+        style=ft.ButtonStyle(
+            shape=ft.RoundedRectangleBorder(radius=8),
+            elevation=8
+        )
+    )
+    
+    queue_done_btn = ft.ElevatedButton(
+        text="Mark Done",
+        icon=ft.Icons.CHECK,
+        on_click=mark_queue_done,
+        style=ft.ButtonStyle(
+            shape=ft.RoundedRectangleBorder(radius=8),
+            elevation=8
+        )
+    )
+    
+    queue_current = ft.Text(
+        value="",
+        size=14,
+        weight=ft.FontWeight.W_600,
+        font_family="Jost",
+        text_align=ft.TextAlign.CENTER
+    )
+    
+    queue_status = ft.Text(
+        value="",
+        size=14,
+        font_family="Jost",
+        text_align=ft.TextAlign.CENTER
+    )
+    
+    queue_section = ft.Container(
+        content=ft.Column([
+            ft.Row([queue_title], alignment=ft.MainAxisAlignment.CENTER),
+            queue_subtitle,
+            ft.Container(queue_numbers, alignment=ft.alignment.center),
+            ft.Container(queue_template, alignment=ft.alignment.center),
+            ft.Container(queue_rate, alignment=ft.alignment.center),
+            ft.Container(queue_add_btn, alignment=ft.alignment.center),
+            ft.Row([
+                queue_next_btn,
+                queue_copy_btn,
+                queue_done_btn
+            ], alignment=ft.MainAxisAlignment.CENTER, wrap=True, spacing=10, run_spacing=10),
+            queue_current,
+            queue_status
+        ], spacing=15, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+        padding=25,
+        margin=10,
+        border_radius=15,
+        shadow=ft.BoxShadow(
+            spread_radius=1,
+            blur_radius=15,
+            color=ft.Colors.BLACK12,
+            offset=ft.Offset(0, 4)
+        ),
+        width=600
+    )
+    
+    update_queue_status()
+    
     # Footer Section
     footer_text = ft.Text(
         "Created by Balqis Zafirah",
@@ -675,7 +1453,7 @@ def main(page: ft.Page):
     refresh_message_list()
     
     # Add dialogs to page
-    page.overlay.extend([add_dialog, edit_dialog, delete_dialog, confirmation_snackbar])
+    page.overlay.extend([add_dialog, edit_dialog, delete_dialog, export_picker, confirmation_snackbar])
     
     # Apply initial theme
     apply_theme()
@@ -684,7 +1462,9 @@ def main(page: ft.Page):
     page.add(
         ft.Column([
             whatsapp_section,
+            export_section,
             messages_section,
+            queue_section,
             footer_container
         ], scroll=ft.ScrollMode.ADAPTIVE, spacing=20, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
     )
@@ -0,0 +1,111 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from gui import OutreachQueue
+
+
+@pytest.fixture
+def queue_file(tmp_path):
+    return str(tmp_path / "outreach_queue.jsonl")
+
+
+def make_queue(queue_file, **kwargs):
+    kwargs.setdefault("per_minute", 1000)
+    return OutreachQueue(queue_file, **kwargs)
+
+
+def numbers(jobs):
+    return [job["phone_number"] for job in jobs]
+
+
+def test_out_of_order_completion_survives_restart(queue_file):
+    queue = make_queue(queue_file)
+    queue.enqueue_many([("012", "Nudge"), ("013", "Nudge"), ("014", "Nudge"), ("015", "Nudge")])
+
+    first = queue.dequeue(2)
+    second = queue.dequeue(1)
+    queue.complete(second)
+    # The cursor can't move past 012 and 013 while they are still outstanding
+    assert queue.state["offset"] == 0
+
+    queue.complete(first)
+    assert queue.state["completed"] == 3
+
+    assert numbers(make_queue(queue_file).dequeue(10)) == ["015"]
+
+
+def test_completing_later_job_does_not_finish_earlier_ones(queue_file):
+    queue = make_queue(queue_file)
+    queue.enqueue_many([("010", "Nudge"), ("011", "Nudge"), ("012", "Nudge")])
+
+    batch = queue.dequeue(3)
+    queue.complete([batch[2]])
+
+    restarted = make_queue(queue_file)
+    jobs = restarted.dequeue(10)
+    assert numbers(jobs) == ["010", "011"]
+
+    restarted.complete(jobs)
+    assert os.path.getsize(queue_file) == 0
+    assert restarted.state["completed"] == 3
+
+
+def test_stale_generation_completion_is_ignored(queue_file):
+    queue = make_queue(queue_file)
+    queue.enqueue_many([("010", "Nudge"), ("011", "Nudge"), ("012", "Nudge"), ("013", "Nudge")])
+
+    first = queue.dequeue(2)
+    second = queue.dequeue(2)
+    queue.complete(second)
+    queue.complete(first)
+    # Everything is done, so the log was emptied and a new generation started
+    assert os.path.getsize(queue_file) == 0
+    assert queue.state["generation"] == 1
+
+    queue.enqueue_many([("02%d" % i, "Nudge") for i in range(5)])
+    assert queue.complete(first) == 0
+    assert queue.state["offset"] == 0
+
+    assert numbers(make_queue(queue_file).dequeue(10)) == ["020", "021", "022", "023", "024"]
+
+
+def test_torn_last_line_is_dropped(queue_file):
+    queue = make_queue(queue_file)
+    queue.enqueue("0123", "Nudge")
+    with open(queue_file, 'ab') as f:
+        f.write(b'["01')
+
+    restarted = make_queue(queue_file)
+    assert numbers(restarted.dequeue(5)) == ["0123"]
+    assert restarted.is_empty()
+
+
+def test_missing_template_is_skipped_and_reported(queue_file):
+    message_manager = SimpleNamespace(messages={"Nudge": "Hello"})
+    queue = make_queue(queue_file, message_manager=message_manager)
+    queue.enqueue_many([("011", "Gone"), ("012", "Nudge"), ("013", "Gone")])
+
+    jobs = queue.dequeue(5)
+    assert numbers(jobs) == ["012"]
+    assert jobs[0]["message"] == "Hello"
+    assert numbers(queue.skipped) == ["011", "013"]
+    with open(queue_file + ".skipped", encoding='utf-8') as f:
+        assert len(f.read().splitlines()) == 2
+
+    queue.complete(jobs)
+    assert queue.state["completed"] == 1
+    assert queue.state["skipped"] == 2
+
+
+def test_per_minute_is_validated_and_persisted(queue_file):
+    for per_minute in (0, -5):
+        with pytest.raises(ValueError):
+            OutreachQueue(queue_file, per_minute=per_minute)
+
+    queue = OutreachQueue(queue_file)
+    assert queue.per_minute == OutreachQueue.default_per_minute
+    queue.set_per_minute(7)
+
+    assert OutreachQueue(queue_file).per_minute == 7